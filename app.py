@@ -3,19 +3,18 @@ Crypto Trading Simulator - Streamlit Cloud Compatible Version
 """
 import streamlit as st
 import pandas as pd
-import plotly.graph_objects as go
-import plotly.express as px
 from datetime import datetime, timedelta
 import time
 import requests
 import json
-from typing import Dict, List
-import streamlit.components.v1 as components
+from typing import TYPE_CHECKING, Dict
 
-# Import our modules
-from trading_engine import portfolio, OrderSide, OrderType, OrderStatus
-from config import SUPPORTED_CRYPTOS, INITIAL_BALANCE, TRADING_FEE
-from tradingview_widget import create_tradingview_widget, create_tradingview_advanced_chart, create_tradingview_screener, create_tradingview_crypto_heatmap
+if TYPE_CHECKING:
+    import plotly.graph_objects as go
+
+# Import our modules (page modules and plotly are imported lazily where used)
+from trading_engine import portfolio
+from config import SUPPORTED_CRYPTOS, INITIAL_BALANCE, BINANCE_SYMBOLS_PARAM
 
 # Page configuration
 st.set_page_config(
@@ -91,7 +90,7 @@ def get_current_prices() -> Dict[str, float]:
     apis = [
         ("CoinGecko", "https://api.coingecko.com/api/v3/simple/price?ids=bitcoin,ethereum,binancecoin,cardano,solana,ripple,polkadot,dogecoin,avalanche-2,polygon&vs_currencies=usd"),
         ("CoinCap", "https://api.coincap.io/v2/assets?limit=10"),
-        ("Binance", "https://api.binance.com/api/v3/ticker/price")
+        ("Binance", f"https://api.binance.com/api/v3/ticker/price?symbols={BINANCE_SYMBOLS_PARAM}")
     ]
     
     for api_name, url in apis:
@@ -100,6 +99,9 @@ def get_current_prices() -> Dict[str, float]:
                 'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
             }
             response = requests.get(url, headers=headers, timeout=10)
+            if api_name == "Binance" and response.status_code == 400:
+                # One unknown symbol (-1121) rejects the whole filtered request; fetch every market instead
+                response = requests.get("https://api.binance.com/api/v3/ticker/price", headers=headers, timeout=10)
             response.raise_for_status()
             
             prices = {}
@@ -146,7 +148,7 @@ def get_current_prices() -> Dict[str, float]:
                         prices[symbol] = float(asset.get('priceUsd', 0))
                         
             elif api_name == "Binance":
-                # Binance format
+                # Binance format (the unfiltered fallback returns every market)
                 for item in data:
                     symbol = item['symbol']
                     if symbol in SUPPORTED_CRYPTOS:
@@ -357,8 +359,10 @@ def get_mock_chart_data(symbol: str, limit: int = 24) -> pd.DataFrame:
     
     return pd.DataFrame(prices)
 
-def create_price_chart(symbol: str, timeframe: str = "1h") -> go.Figure:
+def create_price_chart(symbol: str, timeframe: str = "1h") -> "go.Figure":
     """Create a TradingView-style candlestick chart"""
+    import plotly.graph_objects as go
+    
     df = get_price_chart_data(symbol, timeframe)
     
     if df.empty:
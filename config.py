@@ -1,7 +1,9 @@
 """
 Configuration file for the multi-asset trading platform
 """
+import json
 import os
+import urllib.parse
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -10,11 +12,14 @@ load_dotenv()
 BINANCE_WS_URL = "wss://stream.binance.com:9443/ws/"
 BINANCE_REST_URL = "https://api.binance.com/api/v3/"
 
-# Supported cryptocurrencies (for trading platform)
-SUPPORTED_CRYPTOS = [
+# Supported cryptocurrencies (for trading platform); a tuple so no importer can mutate it
+SUPPORTED_CRYPTOS = (
     "BTCUSDT", "ETHUSDT", "BNBUSDT", "ADAUSDT", "SOLUSDT",
-    "XRPUSDT", "DOTUSDT", "DOGEUSDT", "AVAXUSDT", "MATICUSDT"
-]
+    "XRPUSDT", "DOTUSDT", "DOGEUSDT", "AVAXUSDT"
+)
+
+# Binance ticker filter, so the API only returns the symbols we trade
+BINANCE_SYMBOLS_PARAM = urllib.parse.quote(json.dumps(SUPPORTED_CRYPTOS, separators=(',', ':')))
 
 # Trading simulation settings
 INITIAL_BALANCE = 10000  # Starting balance in USD
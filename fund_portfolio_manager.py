@@ -3,13 +3,12 @@ Fund-Based Portfolio Manager
 Creates themed portfolios instead of strategy-based recommendations
 Uses AI labeling for sectors and themes
 """
-import pandas as pd
 import numpy as np
-from dataclasses import dataclass
+import heapq
+from dataclasses import dataclass, replace
+from functools import lru_cache
 from typing import Dict, List, Optional, Tuple
 from enum import Enum
-from datetime import datetime
-import yfinance as yf
 
 from risk_assessment_engine import RiskProfile, RiskTolerance
 
@@ -68,18 +67,18 @@ class AILabel(Enum):
     DEFENSIVE = "Defensive"
     CYCLICAL = "Cyclical"
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class FundHolding:
     """A single holding in a fund portfolio"""
     symbol: str
     name: str
     sector: str
-    ai_labels: List[AILabel]  # AI-generated labels
+    ai_labels: Tuple[AILabel, ...]  # AI-generated labels
     allocation: float  # Percentage allocation (0-1)
     asset_class: str  # Stock, ETF, Bond, Crypto, etc.
     description: str
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class FundPortfolio:
     """A fund portfolio"""
     theme: PortfolioTheme
@@ -93,6 +92,18 @@ class FundPortfolio:
     rebalancing_frequency: str  # Monthly, Quarterly, etc.
     suitability_score: float  # Match with user profile (0-100)
 
+def _join_symbol_labels(sector_map: Dict[str, str], etf_themes: Dict[str, List[str]],
+                        sector_labels: Dict[str, AILabel],
+                        theme_labels: Dict[str, AILabel]) -> Dict[Tuple[str, str], Tuple[AILabel, ...]]:
+    """Pre-join the static symbol maps into a (symbol, asset_class) -> labels table"""
+    table = {}
+    for symbol, sector in sector_map.items():
+        if sector in sector_labels:
+            table[(symbol, "Stock")] = (sector_labels[sector],)
+    for symbol, themes in etf_themes.items():
+        table[(symbol, "ETF")] = tuple(theme_labels[theme] for theme in themes if theme in theme_labels)
+    return table
+
 class AILabeler:
     """AI system to label investments with sectors, themes, and characteristics"""
     
@@ -159,76 +170,69 @@ class AILabeler:
         "VNQ": ["Real Estate", "REITs", "Income Focused"],
     }
     
+    # Sector name -> AILabel (stocks)
+    SECTOR_LABELS = {
+        "Technology": AILabel.TECHNOLOGY,
+        "Healthcare": AILabel.HEALTHCARE,
+        "Financial Services": AILabel.FINANCIAL,
+        "Energy": AILabel.ENERGY,
+        "Consumer Discretionary": AILabel.CONSUMER,
+        "Consumer Staples": AILabel.CONSUMER,
+        "Industrial": AILabel.INDUSTRIAL,
+        "Materials": AILabel.MATERIALS,
+        "Utilities": AILabel.UTILITIES,
+        "Real Estate": AILabel.REAL_ESTATE,
+        "Communication Services": AILabel.COMMUNICATION,
+    }
+    
+    # ETF theme name -> AILabel
+    THEME_LABELS = {
+        "Technology": AILabel.TECHNOLOGY,
+        "Healthcare": AILabel.HEALTHCARE,
+        "Financial Services": AILabel.FINANCIAL,
+        "Energy": AILabel.ENERGY,
+        "Consumer Discretionary": AILabel.CONSUMER,
+        "Consumer Staples": AILabel.CONSUMER,
+        "Industrial": AILabel.INDUSTRIAL,
+        "Materials": AILabel.MATERIALS,
+        "Utilities": AILabel.UTILITIES,
+        "Real Estate": AILabel.REAL_ESTATE,
+        "US Market": AILabel.US_MARKET,
+        "Emerging Market": AILabel.EMERGING_MARKET,
+        "Developed Market": AILabel.DEVELOPED_MARKET,
+        "Asia Pacific": AILabel.ASIA_PACIFIC,
+        "Europe": AILabel.EUROPE,
+        "Growth Stock": AILabel.GROWTH_STOCK,
+        "Value Stock": AILabel.VALUE_STOCK,
+        "Dividend Stock": AILabel.DIVIDEND_STOCK,
+        "Large Cap": AILabel.LARGE_CAP,
+        "Small Cap": AILabel.SMALL_CAP,
+        "Mid Cap": AILabel.MID_CAP,
+        "Income Focused": AILabel.INCOME_FOCUSED,
+        "REITs": AILabel.REAL_ESTATE,
+        "Defensive": AILabel.DEFENSIVE,
+        "Cyclical": AILabel.CYCLICAL,
+    }
+    
+    # Risk label by asset class (would need real volatility data); anything else is medium risk
+    RISK_LABELS = {
+        "Crypto": AILabel.HIGH_RISK,
+        "Bond": AILabel.LOW_RISK,
+    }
+    
+    # (symbol, asset_class) -> sector/theme labels, joined once from the maps above
+    SYMBOL_LABELS = _join_symbol_labels(SECTOR_MAP, ETF_THEMES, SECTOR_LABELS, THEME_LABELS)
+    
     def label_investment(self, symbol: str, asset_class: str = "Stock") -> List[AILabel]:
         """Generate AI labels for an investment"""
-        labels = []
-        
-        # Get sector label
-        if asset_class == "Stock" and symbol in self.SECTOR_MAP:
-            sector = self.SECTOR_MAP[symbol]
-            # Map sector to AILabel enum
-            sector_map = {
-                "Technology": AILabel.TECHNOLOGY,
-                "Healthcare": AILabel.HEALTHCARE,
-                "Financial Services": AILabel.FINANCIAL,
-                "Energy": AILabel.ENERGY,
-                "Consumer Discretionary": AILabel.CONSUMER,
-                "Consumer Staples": AILabel.CONSUMER,
-                "Industrial": AILabel.INDUSTRIAL,
-                "Materials": AILabel.MATERIALS,
-                "Utilities": AILabel.UTILITIES,
-                "Real Estate": AILabel.REAL_ESTATE,
-                "Communication Services": AILabel.COMMUNICATION,
-            }
-            if sector in sector_map:
-                labels.append(sector_map[sector])
-        
-        # Get ETF theme labels
-        if asset_class == "ETF" and symbol in self.ETF_THEMES:
-            themes = self.ETF_THEMES[symbol]
-            theme_map = {
-                "Technology": AILabel.TECHNOLOGY,
-                "Healthcare": AILabel.HEALTHCARE,
-                "Financial Services": AILabel.FINANCIAL,
-                "Energy": AILabel.ENERGY,
-                "Consumer Discretionary": AILabel.CONSUMER,
-                "Consumer Staples": AILabel.CONSUMER,
-                "Industrial": AILabel.INDUSTRIAL,
-                "Materials": AILabel.MATERIALS,
-                "Utilities": AILabel.UTILITIES,
-                "Real Estate": AILabel.REAL_ESTATE,
-                "US Market": AILabel.US_MARKET,
-                "Emerging Market": AILabel.EMERGING_MARKET,
-                "Developed Market": AILabel.DEVELOPED_MARKET,
-                "Asia Pacific": AILabel.ASIA_PACIFIC,
-                "Europe": AILabel.EUROPE,
-                "Growth Stock": AILabel.GROWTH_STOCK,
-                "Value Stock": AILabel.VALUE_STOCK,
-                "Dividend Stock": AILabel.DIVIDEND_STOCK,
-                "Large Cap": AILabel.LARGE_CAP,
-                "Small Cap": AILabel.SMALL_CAP,
-                "Mid Cap": AILabel.MID_CAP,
-                "Income Focused": AILabel.INCOME_FOCUSED,
-                "REITs": AILabel.REAL_ESTATE,
-                "Defensive": AILabel.DEFENSIVE,
-                "Cyclical": AILabel.CYCLICAL,
-            }
-            for theme in themes:
-                if theme in theme_map:
-                    labels.append(theme_map[theme])
-        
-        # Add risk labels based on volatility (would need real data)
-        if asset_class == "Crypto":
-            labels.append(AILabel.HIGH_RISK)
-        elif asset_class == "Bond":
-            labels.append(AILabel.LOW_RISK)
-        else:
-            labels.append(AILabel.MEDIUM_RISK)
-        
+        labels = list(self.SYMBOL_LABELS.get((symbol, asset_class), ()))
+        labels.append(self.RISK_LABELS.get(asset_class, AILabel.MEDIUM_RISK))
         return labels
     
     def get_investment_name(self, symbol: str) -> str:
         """Get human-readable name for investment"""
+        import yfinance as yf  # Imported on first lookup; heavy and unused by recommendations
+        
         try:
             ticker = yf.Ticker(symbol)
             info = ticker.info
@@ -236,12 +240,29 @@ class AILabeler:
         except:
             return symbol
 
+# Label sets shared by several seeded holdings (immutable, so one tuple serves all)
+_US_MARKET_LARGE_CAP_MEDIUM_RISK_LABELS = (AILabel.US_MARKET, AILabel.LARGE_CAP, AILabel.MEDIUM_RISK)
+_LOW_RISK_INCOME_FOCUSED_LABELS = (AILabel.LOW_RISK, AILabel.INCOME_FOCUSED)
+_TECHNOLOGY_LARGE_CAP_GROWTH_STOCK_LABELS = (AILabel.TECHNOLOGY, AILabel.LARGE_CAP, AILabel.GROWTH_STOCK)
+_DIVIDEND_STOCK_INCOME_FOCUSED_VALUE_STOCK_LABELS = (AILabel.DIVIDEND_STOCK, AILabel.INCOME_FOCUSED, AILabel.VALUE_STOCK)
+_CONSUMER_DIVIDEND_STOCK_BLUE_CHIP_LABELS = (AILabel.CONSUMER, AILabel.DIVIDEND_STOCK, AILabel.BLUE_CHIP)
+_REAL_ESTATE_INCOME_FOCUSED_LABELS = (AILabel.REAL_ESTATE, AILabel.INCOME_FOCUSED)
+
 class FundPortfolioManager:
     """Manages fund-based portfolios"""
     
     def __init__(self):
         self.labeler = AILabeler()
         self.portfolios = self._initialize_portfolios()
+        # Risk levels as one array so suitability is scored in a single vectorized pass
+        self._risk_levels = np.fromiter((p.risk_level for p in self.portfolios),
+                                        dtype=np.float64, count=len(self.portfolios))
+        # Per-tolerance mismatch penalties depend only on the catalog, so build them once
+        self._tolerance_penalties = {
+            RiskTolerance.CONSERVATIVE: np.where(self._risk_levels > 5, 20.0, 0.0),
+            RiskTolerance.AGGRESSIVE: np.where(self._risk_levels < 5, 20.0, 0.0),
+            RiskTolerance.VERY_AGGRESSIVE: np.where(self._risk_levels < 7, 30.0, 0.0),
+        }
     
     def _initialize_portfolios(self) -> List[FundPortfolio]:
         """Initialize fund portfolios"""
@@ -256,15 +277,15 @@ class FundPortfolioManager:
                 expected_volatility=12.0,
                 holdings=[
                     FundHolding("SPY", "S&P 500 ETF", "ETF", 
-                               [AILabel.US_MARKET, AILabel.LARGE_CAP, AILabel.MEDIUM_RISK], 0.30, "ETF", "Broad US market exposure"),
+                               _US_MARKET_LARGE_CAP_MEDIUM_RISK_LABELS, 0.30, "ETF", "Broad US market exposure"),
                     FundHolding("VTI", "Total Stock Market ETF", "ETF",
-                               [AILabel.US_MARKET, AILabel.LARGE_CAP, AILabel.MEDIUM_RISK], 0.25, "ETF", "Total US market"),
+                               _US_MARKET_LARGE_CAP_MEDIUM_RISK_LABELS, 0.25, "ETF", "Total US market"),
                     FundHolding("VEA", "Developed Markets ETF", "ETF",
-                               [AILabel.DEVELOPED_MARKET, AILabel.EUROPE, AILabel.MEDIUM_RISK], 0.20, "ETF", "International developed markets"),
+                               (AILabel.DEVELOPED_MARKET, AILabel.EUROPE, AILabel.MEDIUM_RISK), 0.20, "ETF", "International developed markets"),
                     FundHolding("VWO", "Emerging Markets ETF", "ETF",
-                               [AILabel.EMERGING_MARKET, AILabel.ASIA_PACIFIC, AILabel.HIGH_RISK], 0.15, "ETF", "Emerging markets exposure"),
+                               (AILabel.EMERGING_MARKET, AILabel.ASIA_PACIFIC, AILabel.HIGH_RISK), 0.15, "ETF", "Emerging markets exposure"),
                     FundHolding("TLT", "20+ Year Treasury Bond ETF", "ETF",
-                               [AILabel.LOW_RISK, AILabel.INCOME_FOCUSED], 0.10, "Bond", "Long-term bonds for stability"),
+                               _LOW_RISK_INCOME_FOCUSED_LABELS, 0.10, "Bond", "Long-term bonds for stability"),
                 ],
                 total_allocation=1.0,
                 rebalancing_frequency="Quarterly",
@@ -281,17 +302,17 @@ class FundPortfolioManager:
                 expected_volatility=18.0,
                 holdings=[
                     FundHolding("QQQ", "NASDAQ 100 ETF", "ETF",
-                               [AILabel.TECHNOLOGY, AILabel.GROWTH_STOCK, AILabel.US_MARKET], 0.35, "ETF", "Tech-heavy growth"),
+                               (AILabel.TECHNOLOGY, AILabel.GROWTH_STOCK, AILabel.US_MARKET), 0.35, "ETF", "Tech-heavy growth"),
                     FundHolding("AAPL", "Apple Inc", "Stock",
-                               [AILabel.TECHNOLOGY, AILabel.LARGE_CAP, AILabel.GROWTH_STOCK], 0.15, "Stock", "Tech giant"),
+                               _TECHNOLOGY_LARGE_CAP_GROWTH_STOCK_LABELS, 0.15, "Stock", "Tech giant"),
                     FundHolding("MSFT", "Microsoft Corporation", "Stock",
-                               [AILabel.TECHNOLOGY, AILabel.LARGE_CAP, AILabel.GROWTH_STOCK], 0.15, "Stock", "Cloud and software leader"),
+                               _TECHNOLOGY_LARGE_CAP_GROWTH_STOCK_LABELS, 0.15, "Stock", "Cloud and software leader"),
                     FundHolding("NVDA", "NVIDIA Corporation", "Stock",
-                               [AILabel.TECHNOLOGY, AILabel.GROWTH_STOCK, AILabel.HIGH_RISK], 0.15, "Stock", "AI and GPU leader"),
+                               (AILabel.TECHNOLOGY, AILabel.GROWTH_STOCK, AILabel.HIGH_RISK), 0.15, "Stock", "AI and GPU leader"),
                     FundHolding("TSLA", "Tesla Inc", "Stock",
-                               [AILabel.CONSUMER, AILabel.GROWTH_STOCK, AILabel.HIGH_RISK], 0.10, "Stock", "Electric vehicle leader"),
+                               (AILabel.CONSUMER, AILabel.GROWTH_STOCK, AILabel.HIGH_RISK), 0.10, "Stock", "Electric vehicle leader"),
                     FundHolding("AMZN", "Amazon.com Inc", "Stock",
-                               [AILabel.CONSUMER, AILabel.GROWTH_STOCK, AILabel.LARGE_CAP], 0.10, "Stock", "E-commerce and cloud"),
+                               (AILabel.CONSUMER, AILabel.GROWTH_STOCK, AILabel.LARGE_CAP), 0.10, "Stock", "E-commerce and cloud"),
                 ],
                 total_allocation=1.0,
                 rebalancing_frequency="Monthly",
@@ -308,17 +329,17 @@ class FundPortfolioManager:
                 expected_volatility=10.0,
                 holdings=[
                     FundHolding("VYM", "High Dividend Yield ETF", "ETF",
-                               [AILabel.DIVIDEND_STOCK, AILabel.INCOME_FOCUSED, AILabel.VALUE_STOCK], 0.30, "ETF", "High dividend yield"),
+                               _DIVIDEND_STOCK_INCOME_FOCUSED_VALUE_STOCK_LABELS, 0.30, "ETF", "High dividend yield"),
                     FundHolding("SCHD", "Dividend Equity ETF", "ETF",
-                               [AILabel.DIVIDEND_STOCK, AILabel.INCOME_FOCUSED, AILabel.VALUE_STOCK], 0.25, "ETF", "Quality dividend stocks"),
+                               _DIVIDEND_STOCK_INCOME_FOCUSED_VALUE_STOCK_LABELS, 0.25, "ETF", "Quality dividend stocks"),
                     FundHolding("JNJ", "Johnson & Johnson", "Stock",
-                               [AILabel.HEALTHCARE, AILabel.DIVIDEND_STOCK, AILabel.BLUE_CHIP], 0.15, "Stock", "Healthcare dividend aristocrat"),
+                               (AILabel.HEALTHCARE, AILabel.DIVIDEND_STOCK, AILabel.BLUE_CHIP), 0.15, "Stock", "Healthcare dividend aristocrat"),
                     FundHolding("KO", "Coca-Cola Company", "Stock",
-                               [AILabel.CONSUMER, AILabel.DIVIDEND_STOCK, AILabel.BLUE_CHIP], 0.10, "Stock", "Consumer staples dividend"),
+                               _CONSUMER_DIVIDEND_STOCK_BLUE_CHIP_LABELS, 0.10, "Stock", "Consumer staples dividend"),
                     FundHolding("PG", "Procter & Gamble", "Stock",
-                               [AILabel.CONSUMER, AILabel.DIVIDEND_STOCK, AILabel.BLUE_CHIP], 0.10, "Stock", "Consumer goods dividend"),
+                               _CONSUMER_DIVIDEND_STOCK_BLUE_CHIP_LABELS, 0.10, "Stock", "Consumer goods dividend"),
                     FundHolding("XLU", "Utilities Sector ETF", "ETF",
-                               [AILabel.UTILITIES, AILabel.DIVIDEND_STOCK, AILabel.DEFENSIVE], 0.10, "ETF", "Utilities for income"),
+                               (AILabel.UTILITIES, AILabel.DIVIDEND_STOCK, AILabel.DEFENSIVE), 0.10, "ETF", "Utilities for income"),
                 ],
                 total_allocation=1.0,
                 rebalancing_frequency="Quarterly",
@@ -335,15 +356,15 @@ class FundPortfolioManager:
                 expected_volatility=13.0,
                 holdings=[
                     FundHolding("ESG", "ESG ETF", "ETF",
-                               [AILabel.ESG_COMPLIANT, AILabel.SUSTAINABLE, AILabel.US_MARKET], 0.40, "ETF", "ESG-focused companies"),
+                               (AILabel.ESG_COMPLIANT, AILabel.SUSTAINABLE, AILabel.US_MARKET), 0.40, "ETF", "ESG-focused companies"),
                     FundHolding("TSLA", "Tesla Inc", "Stock",
-                               [AILabel.ESG_COMPLIANT, AILabel.SUSTAINABLE, AILabel.TECHNOLOGY], 0.20, "Stock", "Electric vehicles"),
+                               (AILabel.ESG_COMPLIANT, AILabel.SUSTAINABLE, AILabel.TECHNOLOGY), 0.20, "Stock", "Electric vehicles"),
                     FundHolding("ENPH", "Enphase Energy", "Stock",
-                               [AILabel.ENERGY, AILabel.ESG_COMPLIANT, AILabel.SUSTAINABLE], 0.15, "Stock", "Solar energy"),
+                               (AILabel.ENERGY, AILabel.ESG_COMPLIANT, AILabel.SUSTAINABLE), 0.15, "Stock", "Solar energy"),
                     FundHolding("XLU", "Utilities Sector ETF", "ETF",
-                               [AILabel.UTILITIES, AILabel.ESG_COMPLIANT, AILabel.DEFENSIVE], 0.15, "ETF", "Clean utilities"),
+                               (AILabel.UTILITIES, AILabel.ESG_COMPLIANT, AILabel.DEFENSIVE), 0.15, "ETF", "Clean utilities"),
                     FundHolding("VEA", "Developed Markets ETF", "ETF",
-                               [AILabel.DEVELOPED_MARKET, AILabel.ESG_COMPLIANT], 0.10, "ETF", "International ESG"),
+                               (AILabel.DEVELOPED_MARKET, AILabel.ESG_COMPLIANT), 0.10, "ETF", "International ESG"),
                 ],
                 total_allocation=1.0,
                 rebalancing_frequency="Quarterly",
@@ -360,11 +381,11 @@ class FundPortfolioManager:
                 expected_volatility=14.0,
                 holdings=[
                     FundHolding("VNQ", "Real Estate ETF", "ETF",
-                               [AILabel.REAL_ESTATE, AILabel.INCOME_FOCUSED, AILabel.US_MARKET], 0.50, "ETF", "US real estate"),
+                               (AILabel.REAL_ESTATE, AILabel.INCOME_FOCUSED, AILabel.US_MARKET), 0.50, "ETF", "US real estate"),
                     FundHolding("XLRE", "Real Estate Sector ETF", "ETF",
-                               [AILabel.REAL_ESTATE, AILabel.INCOME_FOCUSED], 0.30, "ETF", "Real estate sector"),
+                               _REAL_ESTATE_INCOME_FOCUSED_LABELS, 0.30, "ETF", "Real estate sector"),
                     FundHolding("SCHH", "US REIT ETF", "ETF",
-                               [AILabel.REAL_ESTATE, AILabel.INCOME_FOCUSED], 0.20, "ETF", "Diversified REITs"),
+                               _REAL_ESTATE_INCOME_FOCUSED_LABELS, 0.20, "ETF", "Diversified REITs"),
                 ],
                 total_allocation=1.0,
                 rebalancing_frequency="Quarterly",
@@ -381,13 +402,13 @@ class FundPortfolioManager:
                 expected_volatility=8.0,
                 holdings=[
                     FundHolding("TLT", "20+ Year Treasury Bond ETF", "ETF",
-                               [AILabel.LOW_RISK, AILabel.INCOME_FOCUSED], 0.40, "Bond", "Long-term bonds"),
+                               _LOW_RISK_INCOME_FOCUSED_LABELS, 0.40, "Bond", "Long-term bonds"),
                     FundHolding("XLP", "Consumer Staples ETF", "ETF",
-                               [AILabel.CONSUMER, AILabel.DEFENSIVE, AILabel.LOW_RISK], 0.25, "ETF", "Stable consumer goods"),
+                               (AILabel.CONSUMER, AILabel.DEFENSIVE, AILabel.LOW_RISK), 0.25, "ETF", "Stable consumer goods"),
                     FundHolding("XLU", "Utilities Sector ETF", "ETF",
-                               [AILabel.UTILITIES, AILabel.DEFENSIVE, AILabel.DIVIDEND_STOCK], 0.20, "ETF", "Defensive utilities"),
+                               (AILabel.UTILITIES, AILabel.DEFENSIVE, AILabel.DIVIDEND_STOCK), 0.20, "ETF", "Defensive utilities"),
                     FundHolding("XLV", "Healthcare Sector ETF", "ETF",
-                               [AILabel.HEALTHCARE, AILabel.DEFENSIVE, AILabel.MEDIUM_RISK], 0.15, "ETF", "Healthcare stability"),
+                               (AILabel.HEALTHCARE, AILabel.DEFENSIVE, AILabel.MEDIUM_RISK), 0.15, "ETF", "Healthcare stability"),
                 ],
                 total_allocation=1.0,
                 rebalancing_frequency="Semi-Annually",
@@ -398,35 +419,38 @@ class FundPortfolioManager:
     def recommend_portfolios(self, profile: RiskProfile, max_portfolios: int = 3) -> List[FundPortfolio]:
         """Recommend fund portfolios based on risk profile"""
         # Calculate suitability scores
-        for portfolio in self.portfolios:
-            portfolio.suitability_score = self._calculate_suitability(portfolio, profile)
+        scores = self._calculate_suitability_scores(profile)
         
-        # Sort by suitability
-        sorted_portfolios = sorted(self.portfolios, key=lambda x: x.suitability_score, reverse=True)
+        # Filter suitable portfolios (score >= 60); each result is a scored copy, because
+        # self.portfolios is shared by every session through get_fund_manager()
+        suitable = [replace(portfolio, suitability_score=score)
+                    for portfolio, score in zip(self.portfolios, scores.tolist()) if score >= 60]
         
-        # Filter suitable portfolios (score >= 60)
-        suitable = [p for p in sorted_portfolios if p.suitability_score >= 60]
-        
-        return suitable[:max_portfolios]
+        # Top matches by suitability (no need to sort the whole list)
+        return heapq.nlargest(max_portfolios, suitable, key=lambda x: x.suitability_score)
     
-    def _calculate_suitability(self, portfolio: FundPortfolio, profile: RiskProfile) -> float:
-        """Calculate how well a portfolio matches the user's risk profile"""
-        score = 100.0
+    def _calculate_suitability_scores(self, profile: RiskProfile) -> np.ndarray:
+        """Calculate how well every portfolio matches the user's risk profile (0-100)"""
+        risk_levels = self._risk_levels
         
         # Risk level matching
-        risk_diff = abs(portfolio.risk_level - profile.score / 10)
-        score -= risk_diff * 10  # Penalize risk mismatch
+        scores = 100.0 - np.abs(risk_levels - profile.score / 10) * 10
         
-        # Risk tolerance matching
-        if profile.risk_tolerance == RiskTolerance.CONSERVATIVE and portfolio.risk_level > 5:
-            score -= 20
-        elif profile.risk_tolerance == RiskTolerance.AGGRESSIVE and portfolio.risk_level < 5:
-            score -= 20
-        elif profile.risk_tolerance == RiskTolerance.VERY_AGGRESSIVE and portfolio.risk_level < 7:
-            score -= 30
+        # Risk tolerance matching (precomputed penalties; none for moderate)
+        penalties = self._tolerance_penalties.get(profile.risk_tolerance)
+        if penalties is not None:
+            scores -= penalties
         
-        return max(0, min(100, score))
+        return np.clip(scores, 0, 100)
+
+@lru_cache(maxsize=1)
+def get_fund_manager() -> FundPortfolioManager:
+    """Shared FundPortfolioManager, built on first use rather than at import"""
+    return FundPortfolioManager()
 
-# Global instance
-fund_manager = FundPortfolioManager()
+def __getattr__(name: str):
+    """Keep `from fund_portfolio_manager import fund_manager` working (lazily)"""
+    if name == "fund_manager":
+        return get_fund_manager()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
@@ -0,0 +1,27 @@
+"""
+Technical indicator kernels for the price charts
+Compiled with numba when it is installed; otherwise they run as plain Python
+"""
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional; kernels then run as plain Python
+    def njit(*args, **kwargs):
+        if args and callable(args[0]):
+            return args[0]
+        return lambda fn: fn
+
+@njit(cache=True)
+def rolling_mean(values: np.ndarray, window: int) -> np.ndarray:
+    """Single-pass sliding-window mean; NaN until the window is full"""
+    n = values.shape[0]
+    out = np.full(n, np.nan)
+    total = 0.0
+    for i in range(n):
+        total += values[i]
+        if i >= window:
+            total -= values[i - window]
+        if i >= window - 1:
+            out[i] = total / window
+    return out
@@ -5,10 +5,6 @@ Supports stocks, bonds, commodities, forex, crypto, and other investment assets
 from dataclasses import dataclass
 from typing import Dict, List, Optional, Any
 from enum import Enum
-import yfinance as yf
-import requests
-import pandas as pd
-from datetime import datetime, timedelta
 
 class AssetClass(Enum):
     STOCKS = "stocks"
@@ -11,7 +11,9 @@ from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Tuple, Any
 import time
 import random
+import threading
 from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
 from multi_asset_config import multi_asset_config, Asset, AssetClass
 
 @dataclass
@@ -43,7 +45,9 @@ class MultiAssetDataProvider:
             "federal_reserve": self._fred_provider
         }
         self.cache = {}
+        self.cache_lock = threading.Lock()  # Bulk fetches read and write the cache from worker threads
         self.cache_duration = 300  # 5 minutes
+        self.session = requests.Session()  # Reuse connections across API calls
         
     def get_current_prices(self, symbols: List[str]) -> Dict[str, PriceData]:
         """Get current prices for multiple symbols"""
@@ -70,8 +74,10 @@ class MultiAssetDataProvider:
         cache_key = f"{symbol}_{period}_{interval}"
         
         # Check cache first
-        if cache_key in self.cache:
-            cached_data, timestamp = self.cache[cache_key]
+        with self.cache_lock:
+            cached = self.cache.get(cache_key)
+        if cached is not None:
+            cached_data, timestamp = cached
             if time.time() - timestamp < self.cache_duration:
                 return cached_data
         
@@ -87,8 +93,10 @@ class MultiAssetDataProvider:
             historical_data = self.providers[provider]([symbol], "historical", period, interval)
             if symbol in historical_data:
                 data = historical_data[symbol]
+                data.data = self._compact_ohlc(data.data)
                 # Cache the result
-                self.cache[cache_key] = (data, time.time())
+                with self.cache_lock:
+                    self.cache[cache_key] = (data, time.time())
                 return data
         except Exception as e:
             print(f"Error fetching historical data for {symbol}: {e}")
@@ -96,6 +104,27 @@ class MultiAssetDataProvider:
         
         return self._get_mock_historical_data(symbol, period, interval)
     
+    def get_historical_data_bulk(self, symbols: List[str], period: str = "1y",
+                                 interval: str = "1d") -> Dict[str, HistoricalData]:
+        """Get historical data for several symbols, fetching them concurrently"""
+        if not symbols:
+            return {}
+        
+        # Each fetch is network-bound, so threads overlap the request latency. Ticker.history is
+        # safe to call concurrently (yf.download runs it on threads itself); four workers match
+        # the chart tab's four-symbol limit and keep the request burst small for Yahoo's rate limits
+        with ThreadPoolExecutor(max_workers=min(4, len(symbols))) as executor:
+            results = executor.map(lambda symbol: self.get_historical_data(symbol, period, interval), symbols)
+            return dict(zip(symbols, results))
+    
+    @staticmethod
+    def _compact_ohlc(df: pd.DataFrame) -> pd.DataFrame:
+        """Store cached OHLC prices as float32 (ample precision for display, half the memory)"""
+        price_columns = [col for col in ('Open', 'High', 'Low', 'Close') if col in df.columns]
+        if price_columns:
+            df[price_columns] = df[price_columns].astype(np.float32)
+        return df
+    
     def _group_symbols_by_provider(self, symbols: List[str]) -> Dict[str, List[str]]:
         """Group symbols by their data provider"""
         groups = {}
@@ -154,6 +183,7 @@ class MultiAssetDataProvider:
             
             # Create ticker objects
             tickers = yf.Tickers(" ".join(converted_symbols))
+            timestamp = datetime.now()  # One timestamp for the whole batch
             
             for yahoo_symbol in converted_symbols:
                 original_symbol = symbol_mapping[yahoo_symbol]
@@ -184,7 +214,7 @@ class MultiAssetDataProvider:
                         change=change,
                         change_percent=change_percent,
                         volume=info.get('volume', 0),
-                        timestamp=datetime.now(),
+                        timestamp=timestamp,
                         high_24h=info.get('dayHigh', current_price),
                         low_24h=info.get('dayLow', current_price),
                         open_24h=info.get('open', current_price)
@@ -259,26 +289,45 @@ class MultiAssetDataProvider:
                     symbol_mapping[binance_symbol] = symbol
             
             if binance_symbols:
+                # Filter server-side so only the requested tickers are decoded
                 url = "https://api.binance.com/api/v3/ticker/24hr"
-                response = requests.get(url, timeout=10)
-                response.raise_for_status()
+                params = {"symbols": json.dumps(binance_symbols, separators=(",", ":"))}
+                response = self.session.get(url, params=params, timeout=10)
+                rejected = []
+                
+                if response.status_code == 400:
+                    # One unknown symbol (-1121) rejects the whole batch, so ask for each ticker on its own
+                    data = []
+                    for binance_symbol in binance_symbols:
+                        response = self.session.get(url, params={"symbol": binance_symbol}, timeout=10)
+                        if response.ok:
+                            data.append(response.json())
+                        else:
+                            rejected.append(symbol_mapping[binance_symbol])
+                else:
+                    response.raise_for_status()
+                    data = response.json()
                 
-                data = response.json()
+                timestamp = datetime.now()  # One fetch, one timestamp for the batch
                 
                 for item in data:
-                    if item['symbol'] in symbol_mapping:
-                        original_symbol = symbol_mapping[item['symbol']]
+                    original_symbol = symbol_mapping.get(item['symbol'])
+                    if original_symbol is not None:
                         prices[original_symbol] = PriceData(
                             symbol=original_symbol,
                             price=float(item['lastPrice']),
                             change=float(item['priceChange']),
                             change_percent=float(item['priceChangePercent']),
                             volume=float(item['volume']),
-                            timestamp=datetime.now(),
+                            timestamp=timestamp,
                             high_24h=float(item['highPrice']),
                             low_24h=float(item['lowPrice']),
                             open_24h=float(item['openPrice'])
                         )
+                
+                # Only the symbols Binance rejected fall back to mock data
+                for symbol in rejected:
+                    prices[symbol] = self._get_mock_price_data(symbol)
         
         except Exception as e:
             print(f"Binance API error: {e}")
@@ -364,33 +413,21 @@ class MultiAssetDataProvider:
         mock_price = self._get_mock_price_data(symbol)
         base_price = mock_price.price
         
-        # Generate price data with random walk
-        prices = []
-        current_price = base_price
-        
-        for i in range(num_points):
-            # Random walk with some trend
-            change = random.uniform(-0.02, 0.02)  # ±2% change
-            current_price *= (1 + change)
-            prices.append(current_price)
+        # Generate price data with a random walk (±2% change per bar)
+        rng = np.random.default_rng()
+        closes = base_price * np.cumprod(1 + rng.uniform(-0.02, 0.02, size=num_points))
+        opens = np.empty_like(closes)
+        opens[:1] = closes[:1]
+        opens[1:] = closes[:-1]
         
         # Create OHLC data
-        data = []
-        for i, (timestamp, close_price) in enumerate(zip(timestamps, prices)):
-            high = close_price * random.uniform(1.0, 1.01)
-            low = close_price * random.uniform(0.99, 1.0)
-            open_price = prices[i-1] if i > 0 else close_price
-            volume = random.uniform(1000000, 10000000)
-            
-            data.append({
-                'Open': open_price,
-                'High': high,
-                'Low': low,
-                'Close': close_price,
-                'Volume': volume
-            })
-        
-        df = pd.DataFrame(data, index=timestamps)
+        df = pd.DataFrame({
+            'Open': opens,
+            'High': closes * rng.uniform(1.0, 1.01, size=num_points),
+            'Low': closes * rng.uniform(0.99, 1.0, size=num_points),
+            'Close': closes,
+            'Volume': rng.uniform(1000000, 10000000, size=num_points)
+        }, index=timestamps)
         
         return HistoricalData(
             symbol=symbol,
@@ -416,31 +416,36 @@ class MultiAssetPortfolio:
         if not self.trades:
             return {"total_trades": 0, "win_rate": 0.0, "avg_trade_return": 0.0}
         
+        # Average buy price per symbol, gathered in a single pass over the trades
+        buy_totals: Dict[str, List[float]] = {}
+        for trade in self.trades:
+            if trade.side == OrderSide.BUY:
+                totals = buy_totals.setdefault(trade.symbol, [0.0, 0])
+                totals[0] += trade.price
+                totals[1] += 1
+        
         # Calculate trade returns
-        trade_returns = []
-        winning_trades = 0
+        # This is simplified - would need to track entry/exit pairs
+        sell_trades = [t for t in self.trades if t.side == OrderSide.SELL and t.symbol in buy_totals]
+        count = len(sell_trades)
+        sell_prices = np.fromiter((t.price for t in sell_trades), dtype=np.float64, count=count)
+        avg_buy_prices = np.fromiter(
+            (buy_totals[t.symbol][0] / buy_totals[t.symbol][1] for t in sell_trades),
+            dtype=np.float64, count=count
+        )
+        trade_returns = (sell_prices - avg_buy_prices) / avg_buy_prices
+        fees = np.fromiter((t.fees for t in self.trades), dtype=np.float64, count=len(self.trades))
         
-        for trade in self.trades:
-            # This is simplified - would need to track entry/exit pairs
-            if trade.side == OrderSide.SELL:
-                # Find corresponding buy trade
-                buy_trades = [t for t in self.trades if t.symbol == trade.symbol and t.side == OrderSide.BUY]
-                if buy_trades:
-                    avg_buy_price = sum(t.price for t in buy_trades) / len(buy_trades)
-                    trade_return = (trade.price - avg_buy_price) / avg_buy_price
-                    trade_returns.append(trade_return)
-                    if trade_return > 0:
-                        winning_trades += 1
-        
-        total_trades = len(trade_returns)
+        total_trades = count
+        winning_trades = int(np.count_nonzero(trade_returns > 0))
         win_rate = (winning_trades / total_trades) * 100 if total_trades > 0 else 0
-        avg_trade_return = np.mean(trade_returns) * 100 if trade_returns else 0
+        avg_trade_return = float(trade_returns.mean()) * 100 if total_trades > 0 else 0
         
         return {
             "total_trades": total_trades,
             "win_rate": win_rate,
             "avg_trade_return": avg_trade_return,
-            "total_fees": sum(trade.fees for trade in self.trades)
+            "total_fees": float(fees.sum())
         }
     
     def get_positions_dataframe(self, current_prices: Dict[str, PriceData]) -> pd.DataFrame:
@@ -479,23 +484,26 @@ class MultiAssetPortfolio:
         if not self.trades:
             return pd.DataFrame()
         
-        data = []
-        for trade in self.trades:
-            asset = self.get_asset_info(trade.symbol)
-            data.append({
-                'ID': trade.id,
-                'Symbol': trade.symbol,
-                'Name': asset.name if asset else trade.symbol,
-                'Asset Class': trade.asset_class,
-                'Side': trade.side.value,
-                'Quantity': trade.quantity,
-                'Price': trade.price,
-                'Fees': trade.fees,
-                'Currency': trade.currency,
-                'Timestamp': trade.timestamp
-            })
-        
-        return pd.DataFrame(data)
+        # Build column-wise: one list per field instead of one dict per row
+        trades = self.trades
+        names = {}
+        for trade in trades:
+            if trade.symbol not in names:
+                asset = self.get_asset_info(trade.symbol)
+                names[trade.symbol] = asset.name if asset else trade.symbol
+        
+        return pd.DataFrame({
+            'ID': [trade.id for trade in trades],
+            'Symbol': [trade.symbol for trade in trades],
+            'Name': [names[trade.symbol] for trade in trades],
+            'Asset Class': [trade.asset_class for trade in trades],
+            'Side': [trade.side.value for trade in trades],
+            'Quantity': np.fromiter((trade.quantity for trade in trades), dtype=np.float64, count=len(trades)),
+            'Price': np.fromiter((trade.price for trade in trades), dtype=np.float64, count=len(trades)),
+            'Fees': np.fromiter((trade.fees for trade in trades), dtype=np.float64, count=len(trades)),
+            'Currency': [trade.currency for trade in trades],
+            'Timestamp': [trade.timestamp for trade in trades]
+        })
     
     def get_orders_dataframe(self) -> pd.DataFrame:
         """Get orders as DataFrame"""
@@ -8,11 +8,18 @@ import plotly.graph_objects as go
 import plotly.express as px
 from datetime import datetime
 import json
+from types import MappingProxyType
 from typing import Dict, List, Any
 
 # Import our robo advisor modules
-from risk_assessment_engine import risk_engine, RiskProfile, RiskTolerance, InvestmentHorizon, ExperienceLevel
-from fund_portfolio_manager import fund_manager, FundPortfolio, FundHolding, AILabel, PortfolioTheme
+from risk_assessment_engine import risk_engine, RiskProfile, RiskTolerance
+from fund_portfolio_manager import get_fund_manager, FundPortfolio
+
+# Tutorial hints keyed by step id (static, shared across reruns)
+TUTORIAL_HINTS = MappingProxyType({
+    "questionnaire": "💡 **Tutorial Hint:** Click the 'Start Risk Assessment' button below to begin the questionnaire!",
+    "view_recommendations": "💡 **Tutorial Hint:** Scroll down to see your personalized recommendations!",
+})
 
 def get_diversified_symbols(profile: RiskProfile) -> List[str]:
     """Get diversified symbols based on risk profile"""
@@ -691,14 +698,13 @@ def display_investment_plan(profile: RiskProfile, portfolios: List[FundPortfolio
 
 def show_tutorial_hints():
     """Show tutorial hints if user is in tutorial mode"""
-    if 'tutorial' in st.session_state and not st.session_state.get('tutorial_completed', False):
-        tutorial = st.session_state.tutorial
+    tutorial = st.session_state.get('tutorial')
+    if tutorial is not None and not st.session_state.get('tutorial_completed', False):
         current_step = tutorial.get_current_step()
         
-        if current_step and current_step.step_id == "questionnaire":
-            st.info("💡 **Tutorial Hint:** Click the 'Start Risk Assessment' button below to begin the questionnaire!")
-        elif current_step and current_step.step_id == "view_recommendations":
-            st.info("💡 **Tutorial Hint:** Scroll down to see your personalized recommendations!")
+        hint = TUTORIAL_HINTS.get(current_step.step_id) if current_step else None
+        if hint:
+            st.info(hint)
 
 def main():
     """Main robo advisor page"""
@@ -762,7 +768,7 @@ def main():
             if st.button("💼 Get Fund Portfolio Recommendations", type="primary"):
                 with st.spinner("Analyzing portfolios for your profile..."):
                     # Get fund portfolio recommendations
-                    portfolios = fund_manager.recommend_portfolios(profile, max_portfolios=3)
+                    portfolios = get_fund_manager().recommend_portfolios(profile, max_portfolios=3)
                     st.session_state.fund_portfolios = portfolios
                     
                     if portfolios:
@@ -250,19 +250,17 @@ class Portfolio:
         if not self.trades:
             return pd.DataFrame()
         
-        data = []
-        for trade in self.trades:
-            data.append({
-                'ID': trade.id,
-                'Symbol': trade.symbol,
-                'Side': trade.side.value,
-                'Quantity': trade.quantity,
-                'Price': trade.price,
-                'Fee': trade.fee,
-                'Timestamp': trade.timestamp
-            })
-        
-        return pd.DataFrame(data)
+        # Build column-wise: one list per field instead of one dict per row
+        trades = self.trades
+        return pd.DataFrame({
+            'ID': [trade.id for trade in trades],
+            'Symbol': [trade.symbol for trade in trades],
+            'Side': [trade.side.value for trade in trades],
+            'Quantity': [trade.quantity for trade in trades],
+            'Price': [trade.price for trade in trades],
+            'Fee': [trade.fee for trade in trades],
+            'Timestamp': [trade.timestamp for trade in trades]
+        })
     
     def get_orders_dataframe(self) -> pd.DataFrame:
         """Get orders as DataFrame"""
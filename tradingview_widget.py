@@ -1,11 +1,13 @@
 """
 TradingView Widget Component for Streamlit
 """
+import streamlit as st
 import streamlit.components.v1 as components
 import json
 
-def create_tradingview_widget(symbol: str, timeframe: str = "1h", height: int = 500):
-    """Create a TradingView widget with the specified symbol and timeframe"""
+@st.cache_data(ttl=3600, show_spinner=False)
+def _tradingview_widget_html(symbol: str, timeframe: str, height: int) -> str:
+    """Render the TradingView widget markup (cached per symbol/timeframe/height)"""
     
     # Map our symbols to TradingView format
     symbol_mapping = {
@@ -96,10 +98,15 @@ def create_tradingview_widget(symbol: str, timeframe: str = "1h", height: int =
     </div>
     """
     
-    return components.html(widget_html, height=height + 50)
+    return widget_html
 
-def create_tradingview_advanced_chart(symbol: str, timeframe: str = "1h", height: int = 600, container_id: str = None):
-    """Create an advanced TradingView chart with more features"""
+def create_tradingview_widget(symbol: str, timeframe: str = "1h", height: int = 500):
+    """Create a TradingView widget with the specified symbol and timeframe"""
+    return components.html(_tradingview_widget_html(symbol, timeframe, height), height=height + 50)
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def _tradingview_advanced_chart_html(symbol: str, timeframe: str, height: int, container_id: str = None) -> str:
+    """Render the advanced TradingView chart markup (cached per argument set)"""
     
     # Map symbols to TradingView format
     symbol_mapping = {
@@ -259,10 +266,18 @@ def create_tradingview_advanced_chart(symbol: str, timeframe: str = "1h", height
     </div>
     """
     
-    return components.html(chart_html, height=height + 50)
+    return chart_html
 
-def create_tradingview_screener():
-    """Create a TradingView market screener widget"""
+def create_tradingview_advanced_chart(symbol: str, timeframe: str = "1h", height: int = 600, container_id: str = None):
+    """Create an advanced TradingView chart with more features"""
+    return components.html(
+        _tradingview_advanced_chart_html(symbol, timeframe, height, container_id),
+        height=height + 50
+    )
+
+@st.cache_resource(show_spinner=False)
+def _tradingview_screener_html() -> str:
+    """Screener markup has no per-user state, so one copy is shared by all sessions"""
     
     screener_html = """
     <div class="tradingview-widget-container">
@@ -304,10 +319,15 @@ def create_tradingview_screener():
     </div>
     """
     
-    return components.html(screener_html, height=650)
+    return screener_html
 
-def create_tradingview_crypto_heatmap():
-    """Create a TradingView cryptocurrency heatmap"""
+def create_tradingview_screener():
+    """Create a TradingView market screener widget"""
+    return components.html(_tradingview_screener_html(), height=650)
+
+@st.cache_resource(show_spinner=False)
+def _tradingview_crypto_heatmap_html() -> str:
+    """Heatmap markup has no per-user state, so one copy is shared by all sessions"""
     
     heatmap_html = """
     <div class="tradingview-widget-container">
@@ -349,4 +369,8 @@ def create_tradingview_crypto_heatmap():
     </div>
     """
     
-    return components.html(heatmap_html, height=450)
+    return heatmap_html
+
+def create_tradingview_crypto_heatmap():
+    """Create a TradingView cryptocurrency heatmap"""
+    return components.html(_tradingview_crypto_heatmap_html(), height=450)
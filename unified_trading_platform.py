@@ -8,7 +8,7 @@ import plotly.graph_objects as go
 import plotly.express as px
 from datetime import datetime, timedelta
 import time
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional, Tuple
 
 # Import our modules
 from trading_engine import portfolio, OrderSide, OrderType, OrderStatus
@@ -19,6 +19,7 @@ from tradingview_widget import create_tradingview_widget, create_tradingview_adv
 from multi_asset_config import multi_asset_config, AssetClass, AssetRegion, AssetSector
 from multi_asset_data_provider import multi_asset_data_provider, PriceData
 from multi_asset_portfolio import multi_asset_portfolio, OrderSide as MAOrderSide, OrderType as MAOrderType, OrderStatus as MAOrderStatus
+from indicators import rolling_mean
 
 # Page configuration
 st.set_page_config(
@@ -160,39 +161,64 @@ def initialize_portfolio():
         multi_asset_portfolio.__init__(INITIAL_BALANCE)
         st.session_state.portfolio_initialized = True
 
+@st.cache_data(ttl=4, show_spinner=False)  # Strictly below the 5 s minimum refresh interval
+def _fetch_current_prices(symbols: Tuple[str, ...]) -> Dict[str, Any]:
+    """Fetch prices for a normalised symbol tuple (shared by identical requests)"""
+    return multi_asset_data_provider.get_current_prices(list(symbols))
+
 def get_current_prices(symbols: List[str]) -> Dict[str, Any]:
     """Get current prices for symbols using appropriate data provider"""
     try:
         # Use multi-asset data provider
-        price_data = multi_asset_data_provider.get_current_prices(symbols)
+        price_data = _fetch_current_prices(tuple(sorted(set(symbols))))
         # Return the full price objects for portfolio calculations
         return price_data
     except Exception as e:
         st.error(f"Error fetching prices: {e}")
         return {}
 
+def get_execution_price(symbol: str) -> Optional[float]:
+    """Get a fresh price for filling an order, bypassing the shared price cache"""
+    try:
+        price_data = multi_asset_data_provider.get_current_prices([symbol]).get(symbol)
+    except Exception as e:
+        st.error(f"Error fetching prices: {e}")
+        return None
+    return price_data.price if hasattr(price_data, 'price') else price_data
+
+# st.fragment is Streamlit >= 1.37; 1.33-1.36 ship it as experimental_fragment
+_fragment = getattr(st, "fragment", None) or getattr(st, "experimental_fragment", None)
+
+def _once(key: str, build):
+    """Build a value at most once per rerun (main() and each fragment tick reset the memo)"""
+    memo = st.session_state.setdefault('_rerun_memo', {})
+    if key not in memo:
+        memo[key] = build()
+    return memo[key]
+
+# Asset class display labels and their reverse lookup, built once from the static config
+_ASSET_CLASSES = multi_asset_config.get_supported_asset_classes()
+_ASSET_CLASS_NAMES = [ac.value.replace('_', ' ').title() for ac in _ASSET_CLASSES]
+_ASSET_CLASS_BY_NAME = dict(zip(_ASSET_CLASS_NAMES, _ASSET_CLASSES))
+
 def create_asset_class_selector():
     """Create asset class selector"""
     st.sidebar.markdown("## 🌍 Asset Class Selection")
     
-    # Always use unified multi-asset platform
-    asset_classes = multi_asset_config.get_supported_asset_classes()
-    asset_class_names = [ac.value.replace('_', ' ').title() for ac in asset_classes]
-    
     # Find the index of the currently selected asset class
     try:
-        selected_index = asset_classes.index(st.session_state.get('selected_asset_class', AssetClass.STOCKS))
+        selected_index = _ASSET_CLASSES.index(st.session_state.get('selected_asset_class', AssetClass.STOCKS))
     except (ValueError, AttributeError):
         selected_index = 0  # Default to first option if not found
     
     selected_name = st.sidebar.selectbox(
         "Select Asset Class",
-        options=asset_class_names,
+        options=_ASSET_CLASS_NAMES,
         index=selected_index
     )
     
     # Update selected asset class
-    selected_asset_class = AssetClass(selected_name.lower().replace(' ', '_'))
+    selected_asset_class = _ASSET_CLASS_BY_NAME[selected_name]
     
     # Clear selected symbols if asset class changed
     if st.session_state.get('selected_asset_class') != selected_asset_class:
@@ -202,24 +228,32 @@ def create_asset_class_selector():
     
     return selected_asset_class
 
+# Asset configuration is static, so each class's option labels are built once per process
+_SYMBOL_OPTIONS: Dict[AssetClass, List[str]] = {}
+
+def _get_symbol_options(asset_class: AssetClass) -> List[str]:
+    """Return the cached "SYMBOL - Name" labels for an asset class"""
+    if asset_class not in _SYMBOL_OPTIONS:
+        assets = multi_asset_config.get_assets_by_class(asset_class)
+        # Limit to 20 for performance
+        _SYMBOL_OPTIONS[asset_class] = [f"{asset.symbol} - {asset.name}" for asset in assets[:20]]
+    return _SYMBOL_OPTIONS[asset_class]
+
 def create_symbol_selector(asset_class: AssetClass):
     """Create symbol selector for the selected asset class"""
     st.sidebar.markdown("### 📊 Symbol Selection")
     
     if asset_class != AssetClass.CRYPTO:
-        # Get assets for the selected class
-        assets = multi_asset_config.get_assets_by_class(asset_class)
+        # Get symbol options for the selected class
+        symbol_options = _get_symbol_options(asset_class)
         
-        if not assets:
+        if not symbol_options:
             st.sidebar.warning("No assets available for this class")
             return []
         
-        # Create symbol options
-        symbol_options = [f"{asset.symbol} - {asset.name}" for asset in assets[:20]]  # Limit to 20 for performance
-        
         # Get current session state symbols and filter to only include valid options
-        current_selected = st.session_state.get('selected_symbols', [])
-        valid_defaults = [option for option in symbol_options if any(symbol in option for symbol in current_selected)]
+        current_selected = set(st.session_state.get('selected_symbols', []))
+        valid_defaults = [option for option in symbol_options if option.split(' - ')[0] in current_selected]
         
         selected_symbols = st.sidebar.multiselect(
             "Select Symbols",
@@ -234,18 +268,15 @@ def create_symbol_selector(asset_class: AssetClass):
         return symbols
     else:
         # Use multi-asset config crypto symbols
-        assets = multi_asset_config.get_assets_by_class(AssetClass.CRYPTO)
+        symbol_options = _get_symbol_options(AssetClass.CRYPTO)
         
-        if not assets:
+        if not symbol_options:
             st.sidebar.warning("No crypto assets available")
             return []
         
-        # Create symbol options
-        symbol_options = [f"{asset.symbol} - {asset.name}" for asset in assets[:20]]  # Limit to 20 for performance
-        
         # Get current session state symbols and filter to only include valid options
-        current_selected = st.session_state.get('selected_symbols', [])
-        valid_defaults = [option for option in symbol_options if any(symbol in option for symbol in current_selected)]
+        current_selected = set(st.session_state.get('selected_symbols', []))
+        valid_defaults = [option for option in symbol_options if option.split(' - ')[0] in current_selected]
         
         selected_symbols = st.sidebar.multiselect(
             "Select Cryptocurrencies",
@@ -473,6 +504,10 @@ def display_market_overview():
         for tip in tips:
             st.markdown(tip)
 
+# Above this many bars SVG candlesticks get sluggish, so the standard chart draws a WebGL
+# close line instead (daily histories here top out near 1,825 bars, well below it)
+CANDLESTICK_MAX_BARS = 10_000
+
 def display_price_charts(symbols: List[str]):
     """Display price charts for selected symbols"""
     if not symbols:
@@ -502,41 +537,56 @@ def display_price_charts(symbols: List[str]):
             timeframe = "1h"  # Default for TradingView widget
     
     # Always use multi-asset data provider (unified platform)
-    for symbol in symbols[:4]:  # Limit to 4 charts for performance
+    chart_symbols = symbols[:4]  # Limit to 4 charts for performance
+    # Use selected timeframe for standard charts, default for TradingView
+    period = timeframe if chart_type == "📊 Standard" else "3mo"
+    histories = multi_asset_data_provider.get_historical_data_bulk(chart_symbols, period=period, interval="1d")
+    
+    for symbol in chart_symbols:
         try:
-            # Use selected timeframe for standard charts, default for TradingView
-            period = timeframe if chart_type == "📊 Standard" else "3mo"
-            historical_data = multi_asset_data_provider.get_historical_data(symbol, period=period, interval="1d")
+            historical_data = histories.get(symbol)
             
             if historical_data and not historical_data.data.empty:
                 df = historical_data.data
                 
                 if chart_type == "📊 Standard":
-                    # Create basic candlestick chart
-                    fig = go.Figure(data=go.Candlestick(
-                        x=df.index,
-                        open=df['Open'],
-                        high=df['High'],
-                        low=df['Low'],
-                        close=df['Close'],
-                        name=symbol
-                    ))
+                    # Create basic candlestick chart from float32 arrays (plotly>=6 sends them as
+                    # base64 typed arrays, half the bytes of float64);
+                    # long histories switch to a WebGL close-price line, as SVG candles bog down
+                    if len(df) > CANDLESTICK_MAX_BARS:
+                        fig = go.Figure(data=go.Scattergl(
+                            x=df.index,
+                            y=df['Close'].to_numpy(dtype='float32'),
+                            mode='lines',
+                            name=symbol
+                        ))
+                    else:
+                        fig = go.Figure(data=go.Candlestick(
+                            x=df.index,
+                            open=df['Open'].to_numpy(dtype='float32'),
+                            high=df['High'].to_numpy(dtype='float32'),
+                            low=df['Low'].to_numpy(dtype='float32'),
+                            close=df['Close'].to_numpy(dtype='float32'),
+                            name=symbol
+                        ))
                     
-                    # Add moving averages
-                    df['MA20'] = df['Close'].rolling(window=20).mean()
-                    df['MA50'] = df['Close'].rolling(window=50).mean()
+                    # Add moving averages (kept local: df is the provider's cached frame),
+                    # dropping the NaN warm-up bars so they are never serialised
+                    close = df['Close'].to_numpy(dtype='float64')
+                    ma20 = rolling_mean(close, 20)[19:]
+                    ma50 = rolling_mean(close, 50)[49:]
                     
                     fig.add_trace(go.Scatter(
-                        x=df.index,
-                        y=df['MA20'],
+                        x=df.index[19:],
+                        y=ma20.astype('float32'),
                         mode='lines',
                         name='MA20',
                         line=dict(color='orange', width=1)
                     ))
                     
                     fig.add_trace(go.Scatter(
-                        x=df.index,
-                        y=df['MA50'],
+                        x=df.index[49:],
+                        y=ma50.astype('float32'),
                         mode='lines',
                         name='MA50',
                         line=dict(color='blue', width=1)
@@ -563,9 +613,8 @@ def display_price_charts(symbols: List[str]):
                     st.markdown(f"### {symbol} - TradingView Chart")
                     st.info(f"Displaying: {symbol} → {tv_symbol}")
                     
-                    # Create unique widget ID with timestamp to force refresh
-                    import time
-                    widget_id = f"tradingview_{symbol}_{int(time.time())}"
+                    # Stable per-symbol widget ID so the rendered markup can be cached
+                    widget_id = f"tradingview_{symbol}"
                     create_tradingview_advanced_chart(tv_symbol, "1h", height=600, container_id=widget_id)
                 
         except Exception as e:
@@ -589,6 +638,10 @@ def create_trading_panel(symbols: List[str]):
         
         selected_symbol = st.selectbox("Select Symbol", options=symbols)
         
+        # Look up and unwrap the current price once per rerun
+        current_price = get_current_prices([selected_symbol]).get(selected_symbol)
+        price_value = current_price.price if hasattr(current_price, 'price') else current_price
+        
         order_side = st.radio("Order Side", ["Buy", "Sell"])
         
         order_type = st.selectbox("Order Type", ["Market", "Limit"])
@@ -603,18 +656,15 @@ def create_trading_panel(symbols: List[str]):
         )
         
         if order_type == "Limit":
-            current_prices = get_current_prices([selected_symbol])
-            raw_price = current_prices.get(selected_symbol, 100)
             # Streamlit requires pure numeric types for number_input defaults
-            current_price = raw_price.price if hasattr(raw_price, "price") else raw_price
             try:
-                price_value = float(current_price)
+                default_limit = float(price_value) if price_value is not None else 100.0
             except (TypeError, ValueError):
-                price_value = 100.0
+                default_limit = 100.0
             limit_price = st.number_input(
                 "Limit Price",
                 min_value=0.01,
-                value=price_value,
+                value=default_limit,
                 step=0.01,
                 format="%.2f"
             )
@@ -637,13 +687,11 @@ def create_trading_panel(symbols: List[str]):
                         price=limit_price
                     )
                     
-                    # Execute market orders immediately
+                    # Execute market orders immediately, at a price fetched now rather than cached
                     if order_type == "Market":
-                        current_prices = get_current_prices([selected_symbol])
-                        current_price = current_prices.get(selected_symbol)
-                        if current_price:
-                            price_value = current_price.price if hasattr(current_price, 'price') else current_price
-                            success = multi_asset_portfolio.execute_order(order, price_value)
+                        fill_price = get_execution_price(selected_symbol)
+                        if fill_price is not None:
+                            success = multi_asset_portfolio.execute_order(order, fill_price)
                             if success:
                                 st.success("✅ Order executed successfully!")
                             else:
@@ -665,13 +713,11 @@ def create_trading_panel(symbols: List[str]):
                         price=limit_price
                     )
                     
-                    # Execute market orders immediately
+                    # Execute market orders immediately, at a price fetched now rather than cached
                     if order_type == "Market":
-                        current_prices = get_current_prices([selected_symbol])
-                        current_price = current_prices.get(selected_symbol)
-                        if current_price:
-                            price_value = current_price.price if hasattr(current_price, 'price') else current_price
-                            success = portfolio.execute_order(order, price_value)
+                        fill_price = get_execution_price(selected_symbol)
+                        if fill_price is not None:
+                            success = portfolio.execute_order(order, fill_price)
                             if success:
                                 st.success("✅ Order executed successfully!")
                             else:
@@ -686,36 +732,24 @@ def create_trading_panel(symbols: List[str]):
     with col2:
         st.markdown("### 📊 Order Summary")
         
-        if selected_symbol:
-            current_prices = get_current_prices([selected_symbol])
-            current_price = current_prices.get(selected_symbol)
+        if selected_symbol and current_price:
+            st.metric(
+                f"{selected_symbol} Current Price",
+                f"${price_value:.2f}",
+                delta="Live"
+            )
             
-            if current_price:
-                price_value = current_price.price if hasattr(current_price, 'price') else current_price
-                st.metric(
-                    f"{selected_symbol} Current Price",
-                    f"${price_value:.2f}",
-                    delta="Live"
-                )
-                
-                # Calculate order details
-                if quantity > 0:
-                    if order_side == "Buy":
-                        total_cost = quantity * (price_value if order_type == "Market" else limit_price)
-                        st.info(f"""
-                        **Buy Order Summary:**
-                        - Quantity: {quantity:.3f} shares
-                        - Price: ${price_value if order_type == "Market" else limit_price:.2f}
-                        - Total Cost: ${total_cost:.2f}
-                        """)
-                    else:
-                        total_proceeds = quantity * (price_value if order_type == "Market" else limit_price)
-                        st.info(f"""
-                        **Sell Order Summary:**
-                        - Quantity: {quantity:.3f} shares
-                        - Price: ${price_value if order_type == "Market" else limit_price:.2f}
-                        - Total Proceeds: ${total_proceeds:.2f}
-                        """)
+            # Calculate order details
+            if quantity > 0:
+                order_price = price_value if order_type == "Market" else limit_price
+                order_value = quantity * order_price
+                is_buy = order_side == "Buy"
+                st.info(f"""
+                **{"Buy" if is_buy else "Sell"} Order Summary:**
+                - Quantity: {quantity:.3f} shares
+                - Price: ${order_price:.2f}
+                - Total {"Cost" if is_buy else "Proceeds"}: ${order_value:.2f}
+                """)
 
 def display_portfolio_summary():
     """Display portfolio summary"""
@@ -814,7 +848,7 @@ def display_positions():
             try:
                 current_prices = get_current_prices(symbols)
                 if current_prices:  # Check if we got valid price data
-                    positions_df = multi_asset_portfolio.get_positions_dataframe(current_prices)
+                    positions_df = _once('ma_positions', lambda: multi_asset_portfolio.get_positions_dataframe(current_prices))
                     
                     if not positions_df.empty:
                         st.dataframe(positions_df, use_container_width=True)
@@ -830,7 +864,7 @@ def display_positions():
         # Original crypto positions
         current_prices = get_current_prices([])
         if current_prices:
-            positions_df = portfolio.get_positions_dataframe(current_prices)
+            positions_df = _once('positions', lambda: portfolio.get_positions_dataframe(current_prices))
             if not positions_df.empty:
                 st.dataframe(positions_df, use_container_width=True)
             else:
@@ -843,7 +877,7 @@ def display_trades():
     st.markdown("## 📋 Recent Trades")
     
     if st.session_state.get('use_multi_asset', True):
-        trades_df = multi_asset_portfolio.get_trades_dataframe()
+        trades_df = _once('ma_trades', multi_asset_portfolio.get_trades_dataframe)
         if not trades_df.empty:
             # Show last 10 trades
             recent_trades = trades_df.tail(10)
@@ -852,7 +886,7 @@ def display_trades():
             st.info("No trades yet")
     else:
         # Original crypto trades
-        trades_df = portfolio.get_trades_dataframe()
+        trades_df = _once('trades', portfolio.get_trades_dataframe)
         if not trades_df.empty:
             # Show last 5 trades
             recent_trades = trades_df.tail(5)
@@ -860,10 +894,58 @@ def display_trades():
         else:
             st.info("No trades yet")
 
+def get_portfolio_snapshot():
+    """Position symbols, their prices and portfolio metrics, computed once per rerun"""
+    def build():
+        symbols = list(multi_asset_portfolio.positions.keys())
+        prices = get_current_prices(symbols) if symbols else {}
+        metrics = multi_asset_portfolio.get_portfolio_metrics(prices) if prices else None
+        return symbols, prices, metrics
+    return _once('portfolio_snapshot', build)
+
+def display_live_portfolio_metrics():
+    """Headline portfolio metrics, re-priced on every refresh tick"""
+    symbols = list(multi_asset_portfolio.positions.keys())
+    if symbols:
+        try:
+            _, current_prices, metrics = get_portfolio_snapshot()
+            if current_prices:  # Check if we got valid price data
+                
+                st.metric("Total Value", f"${metrics.total_value:,.2f}")
+                st.metric("Total P&L", f"${metrics.total_pnl:,.2f}")
+                pnl_color = "normal" if metrics.total_pnl >= 0 else "inverse"
+                st.metric(
+                    "P&L %",
+                    f"{metrics.total_pnl_percent:.2f}%",
+                    delta_color=pnl_color
+                )
+            else:
+                st.warning("Unable to fetch current prices")
+        except Exception as e:
+            st.error(f"Error calculating portfolio metrics: {e}")
+    else:
+        st.info("No positions to display")
+
+def _refresh_live_portfolio_metrics():
+    """Fragment body: stamp the refresh time, then redraw the live metrics"""
+    st.session_state.last_update = time.time()
+    # Drop this rerun's memo so a fragment-only tick re-prices the portfolio
+    st.session_state._rerun_memo = {}
+    display_live_portfolio_metrics()
+    # The sidebar and footer only redraw on full reruns, so the live timing lives here
+    refresh_interval = st.session_state.refresh_interval
+    last_update_dt = datetime.fromtimestamp(st.session_state.last_update)
+    if refresh_interval >= 60:
+        countdown = f"{refresh_interval // 60}m {refresh_interval % 60}s"
+    else:
+        countdown = f"{refresh_interval}s"
+    st.caption(f"Last updated: {last_update_dt.strftime('%H:%M:%S')} | Next refresh in: {countdown}")
+
 def main():
     """Main unified trading platform"""
     # Initialize components
     initialize_portfolio()
+    st.session_state._rerun_memo = {}
     
     # Header
     st.markdown('<h1 class="main-header">🌍 Unified Trading Platform</h1>', unsafe_allow_html=True)
@@ -891,7 +973,12 @@ def main():
                 help="How often to automatically refresh data (5-300 seconds)"
             )
             st.session_state.refresh_interval = refresh_interval
-            
+            if _fragment is not None:
+                st.caption("Auto-refresh updates the Portfolio Summary metrics only; "
+                           "the tabs below refresh on your next interaction.")
+        
+        # With fragments the countdown is drawn inside the refreshing fragment instead
+        if auto_refresh and _fragment is None:
             # Calculate time until next refresh
             current_time = time.time()
             if st.session_state.last_update is None:
@@ -919,29 +1006,12 @@ def main():
         # Symbol selection
         selected_symbols = create_symbol_selector(selected_asset_class)
         
-    # Portfolio summary
+    # Portfolio summary (refreshed on its own when fragments are available)
     st.markdown("## 💰 Portfolio Summary")
-    symbols = list(multi_asset_portfolio.positions.keys())
-    if symbols:
-        try:
-            current_prices = get_current_prices(symbols)
-            if current_prices:  # Check if we got valid price data
-                metrics = multi_asset_portfolio.get_portfolio_metrics(current_prices)
-                
-                st.metric("Total Value", f"${metrics.total_value:,.2f}")
-                st.metric("Total P&L", f"${metrics.total_pnl:,.2f}")
-                pnl_color = "normal" if metrics.total_pnl >= 0 else "inverse"
-                st.metric(
-                    "P&L %",
-                    f"{metrics.total_pnl_percent:.2f}%",
-                    delta_color=pnl_color
-                )
-            else:
-                st.warning("Unable to fetch current prices")
-        except Exception as e:
-            st.error(f"Error calculating portfolio metrics: {e}")
+    if _fragment is not None and st.session_state.auto_refresh_enabled:
+        _fragment(run_every=st.session_state.refresh_interval)(_refresh_live_portfolio_metrics)()
     else:
-        st.info("No positions to display")
+        display_live_portfolio_metrics()
     
     # Main content
     # Create tabs
@@ -955,17 +1025,19 @@ def main():
         # Portfolio Summary
         st.markdown("## 💼 Portfolio Summary")
         
-        # Get portfolio data
-        portfolio_symbols = list(multi_asset_portfolio.positions.keys())
+        # Get portfolio data (shared with the headline metrics above)
+        snapshot_error = None
+        try:
+            portfolio_symbols, portfolio_prices, portfolio_metrics = get_portfolio_snapshot()
+        except Exception as e:
+            portfolio_symbols, portfolio_prices, portfolio_metrics = [], {}, None
+            snapshot_error = e
         
-        if portfolio_symbols:
-            # Get current prices
-            portfolio_prices = get_current_prices(portfolio_symbols)
-            
+        if snapshot_error is not None:
+            st.error(f"Error calculating portfolio metrics: {str(snapshot_error)}")
+        elif portfolio_symbols:
             if portfolio_prices:
                 try:
-                    portfolio_metrics = multi_asset_portfolio.get_portfolio_metrics(portfolio_prices)
-                    
                     # Display key metrics
                     col1, col2, col3, col4 = st.columns(4)
                     
@@ -1033,8 +1105,8 @@ def main():
     if st.session_state.last_update is None:
         st.session_state.last_update = current_time
     
-    # Check if auto-refresh is enabled and time has elapsed
-    if st.session_state.auto_refresh_enabled:
+    # Without fragments, fall back to rerunning the whole script once the interval has elapsed
+    if st.session_state.auto_refresh_enabled and _fragment is None:
         elapsed = current_time - st.session_state.last_update
         if elapsed >= st.session_state.refresh_interval:
             # Time to refresh - update timestamp and rerun
@@ -1050,8 +1122,9 @@ def main():
             st.session_state.last_update = current_time
             st.rerun()
     
-    # Display last update time and next refresh countdown
-    if st.session_state.last_update:
+    # Display last update time and next refresh countdown (the live fragment shows its own)
+    live_fragment = _fragment is not None and st.session_state.auto_refresh_enabled
+    if st.session_state.last_update and not live_fragment:
         last_update_dt = datetime.fromtimestamp(st.session_state.last_update)
         with col2:
             if st.session_state.auto_refresh_enabled: